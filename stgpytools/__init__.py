@@ -1,5 +1,61 @@
-from .enums import *  # noqa: F401, F403
-from .exceptions import *  # noqa: F401, F403
-from .functions import *  # noqa: F401, F403
-from .types import *  # noqa: F401, F403
-from .utils import *  # noqa: F401, F403
+from importlib import import_module as _import_module
+from types import ModuleType as _ModuleType
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
+
+if _TYPE_CHECKING:
+    from .enums import *  # noqa: F401, F403
+    from .exceptions import *  # noqa: F401, F403
+    from .functions import *  # noqa: F401, F403
+    from .types import *  # noqa: F401, F403
+    from .utils import *  # noqa: F401, F403
+
+# Sorted by dependency, so resolving a name only imports the submodules it actually needs.
+_submodules = ('types', 'exceptions', 'functions', 'enums', 'utils')
+
+# Names defined in more than one submodule, resolved to the one a star import of every submodule would keep.
+_overrides = {
+    'base': 'exceptions',
+    'other': 'functions',
+    'generic': 'types',
+    'file': 'utils',
+    'funcs': 'utils',
+}
+
+
+def _import_submodule(name: str) -> _ModuleType:
+    return _import_module(f'.{name}', __name__)
+
+
+def _find_submodule(name: str) -> _ModuleType | None:
+    if name in _overrides:
+        return _import_submodule(_overrides[name])
+
+    for submodule in map(_import_submodule, _submodules):
+        if name in submodule.__dict__:
+            return submodule
+
+    return None
+
+
+def __getattr__(name: str) -> _Any:
+    if name in _submodules:
+        return _import_submodule(name)
+
+    if name == '__all__':
+        value: _Any = list(dict.fromkeys(
+            key for submodule in map(_import_submodule, _submodules)
+            for key in dir(submodule) if not key.startswith('_')
+        ))
+    elif name.startswith('_') or (submodule := _find_submodule(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    else:
+        value = submodule.__dict__[name]
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_submodules, *__getattr__('__all__')})
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TypeVar, overload
 
+from ..exceptions import CustomValueError
+
 __all__ = [
     'Coordinate',
     'Position',
@@ -11,11 +13,13 @@ __all__ = [
 
 class Coordinate:
     """
-    Positive set of (x, y) coordinates.
+    Positive, immutable set of (x, y) coordinates.
 
     :raises ValueError:     Negative values were passed.
     """
 
+    __slots__ = ('x', 'y')
+
     x: int
     """Horizontal coordinate."""
 
@@ -31,8 +35,6 @@ class Coordinate:
         ...
 
     def __init__(self: SelfCoord, x_or_self: int | tuple[int, int] | SelfCoord, y: int | None = None, /) -> None:
-        from ..exceptions import CustomValueError
-
         if isinstance(x_or_self, int):
             x = x_or_self
         else:
@@ -44,8 +46,26 @@ class Coordinate:
         if x < 0 or y < 0:
             raise CustomValueError("Values can't be negative!", self.__class__)
 
-        self.x = x
-        self.y = y
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f'cannot assign to field {name!r}')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'cannot delete field {name!r}')
+
+    def __reduce__(self) -> tuple[type[Coordinate], tuple[int, int]]:
+        return type(self), (self.x, self.y)
+
+    def __eq__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.x, self.y))
 
 
 SelfCoord = TypeVar('SelfCoord', bound=Coordinate)
@@ -54,6 +74,10 @@ SelfCoord = TypeVar('SelfCoord', bound=Coordinate)
 class Position(Coordinate):
     """Positive set of an (x,y) offset relative to the top left corner of an area."""
 
+    __slots__ = ()
+
 
 class Size(Coordinate):
     """Positive set of an (x,y), (horizontal,vertical), size of an area."""
+
+    __slots__ = ()
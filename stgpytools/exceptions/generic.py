@@ -17,9 +17,20 @@ class MismatchError(CustomValueError):
     def _item_to_name(cls, item: Any) -> str:
         return str(item)
 
+    @classmethod
+    def _all_equal(cls, items: Iterable[T]) -> bool:
+        items_iter = iter(items)
+
+        for first in items_iter:
+            first_name = cls._item_to_name(first)
+
+            return all(cls._item_to_name(item) == first_name for item in items_iter)
+
+        return False
+
     @classmethod
     def _reduce(cls, items: Iterable[T]) -> tuple[str]:
-        return tuple[str](dict.fromkeys(map(cls._item_to_name, items)).keys())  # type: ignore
+        return tuple(dict.fromkeys(map(cls._item_to_name, items)))  # type: ignore
 
     def __init__(
         self, func: FuncExceptT, items: Iterable[T], message: SupportsString = 'All items must be equal!',
@@ -29,7 +40,7 @@ class MismatchError(CustomValueError):
 
     @classmethod
     def check(cls, func: FuncExceptT, *items: T, **kwargs: Any) -> None:
-        if len(cls._reduce(items)) != 1:
+        if not cls._all_equal(items):
             raise cls(func, items, **kwargs)
 
 
@@ -41,5 +52,5 @@ class MismatchRefError(MismatchError):
 
     @classmethod
     def check(cls, func: FuncExceptT, *items: T, **kwargs: Any) -> None:
-        if len(cls._reduce(items)) != 1:
+        if not cls._all_equal(items):
             raise cls(func, *items, **kwargs)
@@ -40,6 +40,16 @@ def iterate(
 
     result: T | R = base
 
+    if not kwargs:
+        if not args:
+            for _ in range(count):
+                result = function(result)  # type: ignore[call-arg]
+        else:
+            for _ in range(count):
+                result = function(result, *args)  # type: ignore[call-arg]
+
+        return result
+
     for _ in range(count):
         result = function(result, *args, **kwargs)
 
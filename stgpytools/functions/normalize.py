@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from fractions import Fraction
-from typing import Any, Iterable, Iterator, Sequence, overload
+import sys
+from collections.abc import Iterable
+from itertools import groupby, repeat
+from typing import Any, Iterator, Sequence, overload
 
 from ..types import F, SupportsString, T, SoftRange, SoftRangeN, SoftRangesN, StrictRange
 
@@ -42,9 +44,12 @@ def normalize_seq(val: T | Sequence[T], length: int) -> list[T]:
 
     val = to_arr(val)
 
-    val += [val[-1]] * (length - len(val))
+    if (missing := length - len(val)) > 0:
+        val.extend(repeat(val[-1], missing))
+    elif missing:
+        del val[length:]
 
-    return val[:length]
+    return val
 
 
 _iterables_t = (list, tuple, range, zip, set, map, enumerate)
@@ -64,11 +69,14 @@ def to_arr(val: T | Sequence[T], *, sub: bool = False) -> list[T]:
     """Normalize any value into an iterable."""
 
     if sub:
-        return list(val) if any(isinstance(val, x) for x in _iterables_t) else [val]  # type: ignore
+        return list(val) if isinstance(val, _iterables_t) else [val]  # type: ignore
 
     return list(val) if type(val) in _iterables_t else [val]  # type: ignore
 
 
+_flatten_skip_t = (str, bytes)
+
+
 @overload
 def flatten(items: T | Iterable[T | Iterable[T | Iterable[T]]]) -> Iterable[T]:
     ...
@@ -87,12 +95,17 @@ def flatten(items: T | Iterable[T]) -> Iterable[T]:  # type: ignore
 def flatten(items: Any) -> Any:
     """Flatten an array of values."""
 
-    for val in items:
-        if isinstance(val, Iterable) and not isinstance(val, (str, bytes)):
-            for sub_x in flatten(val):
-                yield sub_x
-        else:
+    stack = [iter(items)]
+
+    while stack:
+        for val in stack[-1]:
+            if isinstance(val, Iterable) and not isinstance(val, _flatten_skip_t):
+                stack.append(iter(val))
+                break
+
             yield val
+        else:
+            stack.pop()
 
 
 def normalize_range(ranges: SoftRange, /) -> Iterable[int]:
@@ -117,28 +130,22 @@ def normalize_range(ranges: SoftRange, /) -> Iterable[int]:
 
 
 def normalize_list_to_ranges(flist: Iterable[int], min_length: int = 0) -> list[StrictRange]:
-    flist2 = list[list[int]]()
-    flist3 = list[int]()
-
-    prev_n = -1
+    # Ascending ranges are already sorted and unique
+    if isinstance(flist, range) and flist.step > 0:
+        sorted_unique: Iterable[int] = flist
+    else:
+        sorted_unique = sorted(set(flist))
 
-    for n in sorted(set(flist)):
-        if prev_n + 1 != n:
-            if flist3:
-                flist2.append(flist3)
-                flist3 = []
-        flist3.append(n)
-        prev_n = n
+    out = list[StrictRange]()
 
-    if flist3:
-        flist2.append(flist3)
+    # Consecutive numbers share the same difference with their index
+    for _, group in groupby(enumerate(sorted_unique), lambda x: x[1] - x[0]):
+        run = [n for _, n in group]
 
-    flist4 = [i for i in flist2 if len(i) > min_length]
+        if len(run) > min_length:
+            out.append((run[0], run[-1]))
 
-    return list(zip(
-        [i[0] for i in flist4],
-        [i[-1] for j, i in enumerate(flist4)]
-    ))
+    return out
 
 
 def normalize_ranges_to_list(ranges: Iterable[SoftRange]) -> list[int]:
@@ -202,17 +209,38 @@ def normalize_ranges(ranges: SoftRangeN | SoftRangesN, end: int) -> list[StrictR
 
         out.append((start, endd))
 
-    return normalize_list_to_ranges([
-        x for start, endd in out for x in range(start, endd + 1)
-    ])
+    merged = list[StrictRange]()
+
+    for start, endd in sorted(out):
+        if start > endd:
+            continue
+
+        if merged and start <= merged[-1][1] + 1:
+            if endd > merged[-1][1]:
+                merged[-1] = (merged[-1][0], endd)
+        else:
+            merged.append((start, endd))
+
+    return merged
 
 
 def invert_ranges(ranges: SoftRangeN | SoftRangesN, enda: int, endb: int | None) -> list[StrictRange]:
     norm_ranges = normalize_ranges(ranges, enda if endb is None else endb)
 
-    b_frames = {*normalize_ranges_to_list(norm_ranges)}
+    out = list[StrictRange]()
+
+    prev_end = -1
 
-    return normalize_list_to_ranges({*range(enda)} - b_frames)
+    for start, endd in norm_ranges:
+        if start > prev_end + 1 and prev_end + 1 < enda:
+            out.append((prev_end + 1, min(start, enda) - 1))
+
+        prev_end = max(prev_end, endd)
+
+    if prev_end + 1 < enda:
+        out.append((prev_end + 1, enda - 1))
+
+    return out
 
 
 def norm_func_name(func_name: SupportsString | F) -> str:
@@ -245,7 +273,8 @@ def norm_display_name(obj: object) -> str:
     if isinstance(obj, Iterator):
         return ', '.join(norm_display_name(v) for v in obj).strip()
 
-    if isinstance(obj, Fraction):
+    # If fractions was never imported, obj can't be a Fraction
+    if (fractions := sys.modules.get('fractions')) and isinstance(obj, fractions.Fraction):
         return f'{obj.numerator}/{obj.denominator}'
 
     if isinstance(obj, dict):
@@ -8,11 +8,15 @@ __all__ = [
 
 
 def deepmerge(source: dict[Any, Any], destination: dict[Any, Any]) -> dict[Any, Any]:
-    for key, value in source.items():
-        if isinstance(value, dict):
-            node = destination.setdefault(key, {})
-            deepmerge(value, node)
-        else:
-            destination[key] = value
+    stack = [(source, destination)]
+
+    while stack:
+        src, dst = stack.pop()
+
+        for key, value in src.items():
+            if isinstance(value, dict):
+                stack.append((value, dst.setdefault(key, {})))
+            else:
+                dst[key] = value
 
     return destination
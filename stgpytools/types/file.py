@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import fnmatch
-import shutil
-from os import PathLike, listdir, path, walk
+import re
+from itertools import chain
+from os import DirEntry, PathLike, fspath, path, rename, scandir, unlink
+from os import name as os_name
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, TypeAlias, Union
+from stat import S_ISREG
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal, TypeAlias, Union, get_args
 
 __all__ = [
     'FilePathType', 'FileDescriptor',
@@ -21,6 +24,9 @@ __all__ = [
     'OpenTextMode',
     'OpenBinaryMode',
 
+    'OPEN_TEXT_MODES',
+    'OPEN_BINARY_MODES',
+
     'SPath', 'SPathLike'
 ]
 
@@ -55,10 +61,57 @@ OpenBinaryModeReading: TypeAlias = Literal[
 OpenTextMode: TypeAlias = OpenTextModeUpdating | OpenTextModeWriting | OpenTextModeReading
 OpenBinaryMode: TypeAlias = OpenBinaryModeUpdating | OpenBinaryModeReading | OpenBinaryModeWriting
 
+OPEN_TEXT_MODES = frozenset[str](
+    mode for literal in get_args(OpenTextMode) for mode in get_args(literal)
+)
+"""All the valid modes for opening a file in text mode."""
+
+OPEN_BINARY_MODES = frozenset[str](
+    mode for literal in get_args(OpenBinaryMode) for mode in get_args(literal)
+)
+"""All the valid modes for opening a file in binary mode."""
+
+
+def _compile_pattern(pattern: str) -> Callable[[str], re.Match[str] | None]:
+    """Compile a glob pattern once, to be matched against names normalized with os.path.normcase."""
+
+    return re.compile(fnmatch.translate(path.normcase(pattern))).match
+
+
+def _scandir_recursive(top: str) -> Iterator[DirEntry[str]]:
+    """Yield the entries of all the files under ``top``, without following symlinked directories."""
+
+    stack = [top]
+
+    while stack:
+        files = list[DirEntry[str]]()
+
+        try:
+            with scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry)
+        except OSError:
+            continue
+
+        # Inode order keeps the following stat calls mostly sequential on disk,
+        # on Windows getting the inode would need an extra syscall per entry
+        if os_name != 'nt':
+            files.sort(key=DirEntry.inode)
+
+        yield from files
+
 
 class SPath(Path):
     """Modified version of pathlib.Path"""
 
+    __slots__ = ('_resolved',)
+
+    _resolved: bool
+    """Whether this path is already the result of a resolve, unset otherwise."""
+
     if TYPE_CHECKING:
         def __new__(cls, *args: SPathLike, **kwargs: Any) -> SPath:
             ...
@@ -76,12 +129,19 @@ class SPath(Path):
     def get_folder(self) -> SPath:
         """Get the folder of the path."""
 
-        folder_path = self.resolve()
+        if getattr(self, '_resolved', False):
+            folder_path = self
+        else:
+            folder_path = self.resolve()
+            folder_path._resolved = True
 
         if folder_path.is_dir():
             return folder_path
 
-        return SPath(path.dirname(folder_path))
+        folder_path = folder_path.parent
+        folder_path._resolved = True
+
+        return folder_path
 
     def mkdirp(self, mode: int = 0o777) -> None:
         """Make the dir path with its parents."""
@@ -91,6 +151,8 @@ class SPath(Path):
     def rmdirs(self, missing_ok: bool = False, ignore_errors: bool = True) -> None:
         """Remove the dir path with its contents."""
 
+        import shutil
+
         try:
             return shutil.rmtree(str(self.get_folder()), ignore_errors)
         except FileNotFoundError:
@@ -102,7 +164,11 @@ class SPath(Path):
     ) -> list[str]:
         """Read the file and return its lines."""
 
-        return super().read_text(encoding, errors).splitlines(keepends)
+        with self.open(encoding=encoding, errors=errors) as f:
+            if keepends:
+                return f.readlines()
+
+            return [line.rstrip('\n') for line in f]
 
     def write_lines(
         self, data: Iterable[str], encoding: str | None = None,
@@ -110,33 +176,59 @@ class SPath(Path):
     ) -> int:
         """Open the file and write the given lines."""
 
-        return super().write_text('\n'.join(data), encoding, errors, newline)
+        lines = iter(data)
+
+        # Written line by line, so the whole content never has to be joined in memory
+        with self.open('w', encoding=encoding, errors=errors, newline=newline) as f:
+            written = f.write(next(lines, ''))
+
+            for line in lines:
+                written += f.write('\n' + line)
+
+        return written
 
     def append_to_stem(self, suffixes: str | Iterable[str], sep: str = '_') -> SPath:
         """Append a suffix to the stem of the path"""
 
-        from ..functions import to_arr
+        if isinstance(suffixes, str):
+            stem = f'{self.stem}{sep}{suffixes}'
+        else:
+            from ..functions import to_arr
+
+            stem = sep.join([self.stem, *to_arr(suffixes)])  # type:ignore[list-item]
 
-        return self.with_stem(sep.join([self.stem, *to_arr(suffixes)]))  # type:ignore[list-item]
+        # with_stem is just a with_name call, adding the suffix here saves the extra dispatch
+        return self.with_name(stem + self.suffix)
 
     def is_empty_dir(self) -> bool:
         """Check if the directory is empty."""
 
-        return self.is_dir() and not any(self.iterdir())
+        try:
+            with scandir(self) as entries:
+                return next(entries, None) is None
+        except (FileNotFoundError, NotADirectoryError):
+            return False
 
     def move_dir(self, dst: SPath, *, mode: int = 0o777) -> None:
         """Move the directory to the specified destination."""
 
         dst.mkdir(mode, True, True)
 
-        for file in listdir(self):
-            src_file = self / file
-            dst_file = dst / file
+        # Ends with a separator, so each entry name only needs appending
+        dst_dir = path.join(fspath(dst), '')
+
+        # Read the whole listing first, entries get moved out while looping
+        with scandir(self) as entries_it:
+            entries = list(entries_it)
+
+        for entry in entries:
+            dst_file = dst_dir + entry.name
 
-            if dst_file.exists():
-                src_file.unlink()
+            # Existing files in the destination are kept, os.replace would overwrite them
+            if path.exists(dst_file):
+                unlink(entry.path)
             else:
-                src_file.rename(dst_file)
+                rename(entry.path, dst_file)
 
         self.rmdir()
 
@@ -147,6 +239,8 @@ class SPath(Path):
             from ..exceptions import PathIsNotADirectoryError
             raise PathIsNotADirectoryError('The given path, \"{self}\" is not a directory!', self.copy_dir)
 
+        import shutil
+
         dst.mkdirp()
         shutil.copytree(self, dst, dirs_exist_ok=True)
 
@@ -155,39 +249,90 @@ class SPath(Path):
     def lglob(self, pattern: str = '*') -> list[SPath]:
         """Glob the path and return the list of paths."""
 
-        return list(map(SPath, self.glob(pattern)))
+        return list(self.glob(pattern))
 
     def fglob(self, pattern: str = '*') -> SPath | None:
         """Glob the path and return the first match."""
 
-        for root, dirs, files in walk(self):
-            for name in dirs + files:
-                if fnmatch.fnmatch(name, pattern):
-                    return SPath(path.join(root, name))
+        match = _compile_pattern(pattern)
+
+        stack = [self.to_str()]
+
+        while stack:
+            dirs, files = list[DirEntry[str]](), list[DirEntry[str]]()
+
+            try:
+                with scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+
+                        (dirs if is_dir else files).append(entry)
+            except OSError:
+                continue
+
+            # Like os.walk, directories are matched before the files next to them
+            for entry in chain(dirs, files):
+                if match(path.normcase(entry.name)):
+                    return SPath(entry.path)
+
+            stack.extend(reversed([entry.path for entry in dirs if not entry.is_symlink()]))
 
         return None
 
     def find_newest_file(self, pattern: str = '*') -> SPath | None:
         """Find the most recently modified file matching the given pattern in the directory."""
 
-        matching_files = self.get_folder().glob(pattern)
+        folder = self.get_folder()
+
+        # Patterns spanning multiple components still need pathlib's glob
+        if not pattern or '**' in pattern or '/' in pattern or path.sep in pattern:
+            return max(folder.glob(pattern), key=lambda p: p.stat().st_mtime, default=None)
+
+        # Everything matches '*', no need to check the names
+        match = None if pattern == '*' else _compile_pattern(pattern)
+
+        newest, newest_mtime = None, 0.0
 
-        if not matching_files:
-            return None
+        with scandir(folder) as entries:
+            for entry in entries:
+                if match and not match(path.normcase(entry.name)):
+                    continue
 
-        return max(matching_files, key=lambda p: p.stat().st_mtime, default=None)  # type:ignore
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+
+                if newest is None or mtime > newest_mtime:
+                    newest, newest_mtime = entry.path, mtime
+
+        return None if newest is None else SPath(newest)
 
     def get_size(self) -> int:
         """Get the size of the file or directory in bytes."""
 
-        if not self.exists():
+        try:
+            stat_result = self.stat()
+        except (FileNotFoundError, NotADirectoryError):
             from ..exceptions import FileNotExistsError
             raise FileNotExistsError('The given path, \"{self}\" is not a file or directory!', self.get_size)
 
-        if self.is_file():
-            return self.stat().st_size
+        if S_ISREG(stat_result.st_mode):
+            return stat_result.st_size
+
+        total = 0
+
+        for entry in _scandir_recursive(self.to_str()):
+            # The file could have been removed since it was listed
+            try:
+                total += entry.stat().st_size
+            except FileNotFoundError:
+                continue
 
-        return sum(f.stat().st_size for f in self.rglob('*') if f.is_file())
+        return total
 
 
 SPathLike = Union[str, Path, SPath]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from typing import (
-    Any, Callable, Iterable, Protocol, SupportsFloat, SupportsIndex, TypeAlias, TypeVar, overload, runtime_checkable
+    Any, Callable, Iterable, Protocol, SupportsFloat, SupportsIndex, TypeAlias, TypeVar, overload
 )
 
 from .builtins import T0, T1, T2, T_contra
@@ -30,44 +30,37 @@ _KT = TypeVar('_KT')
 _VT_co = TypeVar('_VT_co', covariant=True)
 
 
-@runtime_checkable
 class SupportsTrunc(Protocol):
     def __trunc__(self) -> int:
         ...
 
 
-@runtime_checkable
 class SupportsString(Protocol):
     @abstractmethod
     def __str__(self) -> str:
         ...
 
 
-@runtime_checkable
 class SupportsDunderLT(Protocol[T_contra]):
     def __lt__(self, __other: T_contra) -> bool:
         ...
 
 
-@runtime_checkable
 class SupportsDunderGT(Protocol[T_contra]):
     def __gt__(self, __other: T_contra) -> bool:
         ...
 
 
-@runtime_checkable
 class SupportsDunderLE(Protocol[T_contra]):
     def __le__(self, __other: T_contra) -> bool:
         ...
 
 
-@runtime_checkable
 class SupportsDunderGE(Protocol[T_contra]):
     def __ge__(self, __other: T_contra) -> bool:
         ...
 
 
-@runtime_checkable
 class SupportsAllComparisons(
     SupportsDunderLT[Any], SupportsDunderGT[Any], SupportsDunderLE[Any], SupportsDunderGE[Any], Protocol
 ):
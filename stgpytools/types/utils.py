@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from functools import partial, wraps
-from inspect import Signature
+from bisect import bisect_right
+from functools import wraps
+from inspect import Parameter, Signature
 from inspect import _empty as empty_param
 from inspect import isclass
+from itertools import pairwise
+from operator import attrgetter
 from typing import (
-    TYPE_CHECKING, Any, Callable, Concatenate, Generator, Generic, Iterable, Iterator, Mapping, NoReturn, Protocol,
+    TYPE_CHECKING, Any, Callable, Concatenate, Generic, Iterable, Iterator, Mapping, NoReturn, Protocol,
     Sequence, TypeVar, cast, no_type_check, overload
 )
+from weakref import WeakKeyDictionary
 
 from .builtins import F0, F1, P0, P1, R0, R1, T0, T1, T2, KwargsT, P, R, T
 
@@ -97,7 +101,22 @@ class injected_self_func(Generic[T, P, R], Protocol):  # type: ignore[misc]
         ...
 
 
-self_objects_cache = dict[type[T], T]()  # type: ignore
+self_objects_cache: dict[type, Any] = {}
+
+_signatures_cache = WeakKeyDictionary[Callable[..., Any], Signature]()
+
+
+def _get_signature(function: Callable[..., Any]) -> Signature:
+    """Get the signature of a function, inspecting the same function only once."""
+
+    try:
+        if (signature := _signatures_cache.get(function)) is None:
+            signature = _signatures_cache[function] = Signature.from_callable(function)
+    except TypeError:
+        # The function can't be weakly referenced or hashed, so it can't be cached
+        signature = Signature.from_callable(function)
+
+    return signature
 
 
 class inject_self_base(Generic[T, P, R]):
@@ -109,75 +128,72 @@ class inject_self_base(Generic[T, P, R]):
         :param cache:       Whether to cache the self object.
         """
 
-        self.cache = self.init_kwargs = None
+        self.cache = None
 
         if isinstance(self, inject_self.cached):
             self.cache = True
 
         self.function = function
 
-        self.signature = self.first_key = self.init_kwargs = None
+        # Only the parameters are needed, annotations are left unevaluated so forward references still work
+        self.signature = _get_signature(function)
+        self.first_key = next(iter(self.signature.parameters), None)
+
+        self.init_kwargs: frozenset[str] | None = None
 
-        self.args = tuple[Any]()
-        self.kwargs = dict[str, Any]()
+        if isinstance(self, inject_self.init_kwargs):
+            from ..exceptions import CustomValueError
+
+            if not any(x.kind is Parameter.VAR_KEYWORD for x in self.signature.parameters.values()):
+                raise CustomValueError(
+                    'This function hasn\'t got any kwargs!', 'inject_self.init_kwargs', self.function
+                )
+
+            self.init_kwargs = frozenset(
+                k for k, x in self.signature.parameters.items() if x.kind is not Parameter.VAR_KEYWORD
+            )
+
+        self.args: tuple[Any, ...] = ()
+        self.kwargs: dict[str, Any] = {}
 
         self.clean_kwargs = False
 
     def __get__(
         self, class_obj: type[T] | T | None, class_type: type[T] | type[type[T]]  # type: ignore
     ) -> injected_self_func[T, P, R]:
-        if not self.signature or not self.first_key:  # type: ignore
-            self.signature = Signature.from_callable(self.function, eval_str=True)  # type: ignore
-            self.first_key = next(iter(list(self.signature.parameters.keys())), None)  # type: ignore
+        function, first_key = self.function, self.first_key
 
-            if isinstance(self, inject_self.init_kwargs):
-                from ..exceptions import CustomValueError
-
-                if 4 not in {x.kind for x in self.signature.parameters.values()}:  # type: ignore
-                    raise CustomValueError(
-                        'This function hasn\'t got any kwargs!', 'inject_self.init_kwargs', self.function
-                    )
-
-                self.init_kwargs = list[str](  # type: ignore
-                    k for k, x in self.signature.parameters.items() if x.kind != 4  # type: ignore
-                )
-
-        @wraps(self.function)
+        @wraps(function)
         def _wrapper(*args: Any, **kwargs: Any) -> Any:
             first_arg = (args[0] if args else None) or (
-                kwargs.get(self.first_key, None) if self.first_key else None  # type: ignore
+                kwargs.get(first_key, None) if first_key else None
             )
 
-            if (
-                first_arg and (
-                    (is_obj := isinstance(first_arg, class_type))
-                    or isinstance(first_arg, type(class_type))  # noqa
-                    or first_arg is class_type  # noqa
-                )
+            # A self can be passed as an instance, a class of the same metaclass, or the class itself
+            if first_arg and (
+                (is_obj := isinstance(first_arg, class_type))
+                or first_arg is class_type or isinstance(first_arg, type(class_type))
             ):
-                obj = first_arg if is_obj else first_arg()
+                obj = first_arg if is_obj else first_arg()  # type: ignore
                 if args:
                     args = args[1:]
-                elif kwargs and self.first_key:
-                    kwargs.pop(self.first_key)  # type: ignore
-            elif class_obj is None:
-                if self.cache:
-                    if class_type not in self_objects_cache:
-                        obj = self_objects_cache[class_type] = class_type(*self.args, **self.kwargs)
-                    else:
-                        obj = self_objects_cache[class_type]
-                elif self.init_kwargs:
-                    obj = class_type(  # type: ignore
-                        *self.args, **(self.kwargs | {k: v for k, v in kwargs.items() if k not in self.init_kwargs})
-                    )
-                    if self.clean_kwargs:
-                        kwargs = {k: v for k, v in kwargs.items() if k in self.init_kwargs}
-                else:
-                    obj = class_type(*self.args, **self.kwargs)
-            else:
+                elif kwargs and first_key:
+                    kwargs.pop(first_key)
+            elif class_obj is not None:
                 obj = class_obj
+            elif self.cache:
+                if (obj := self_objects_cache.get(class_type)) is None:
+                    obj = self_objects_cache[class_type] = class_type(*self.args, **self.kwargs)
+            elif init_kwargs := self.init_kwargs:
+                obj = class_type(
+                    *self.args, **(self.kwargs | {k: v for k, v in kwargs.items() if k not in init_kwargs})
+                )
+                if self.clean_kwargs:
+                    kwargs = {k: v for k, v in kwargs.items() if k in init_kwargs}
+            else:
+                obj = class_type(*self.args, **self.kwargs)
 
-            return self.function(obj, *args, **kwargs)
+            return function(obj, *args, **kwargs)  # type: ignore
 
         return _wrapper
 
@@ -186,7 +202,7 @@ class inject_self_base(Generic[T, P, R]):
 
     @property
     def __signature__(self) -> Signature:
-        return Signature.from_callable(self.function)
+        return self.signature
 
     @classmethod
     def with_args(
@@ -254,32 +270,33 @@ class inject_kwargs_params_base(Generic[T, P, R]):
     def __init__(self, function: Callable[Concatenate[T, P], R]) -> None:
         self.function = function
 
-        self.signature = None
+        # Only the parameters are needed, annotations are left unevaluated so forward references still work
+        self.signature = _get_signature(function)
 
-    def __get__(
-        self, class_obj: T, class_type: type[T]
-    ) -> inject_kwargs_params_base_func[T, P, R]:
-        if not self.signature:
-            self.signature = Signature.from_callable(self.function, eval_str=True)  # type: ignore
+        if (
+            isinstance(self, inject_kwargs_params.add_to_kwargs)  # type: ignore
+            and not any(x.kind is Parameter.VAR_KEYWORD for x in self.signature.parameters.values())  # type: ignore
+        ):
+            from ..exceptions import CustomValueError
 
-            if (
-                isinstance(self, inject_kwargs_params.add_to_kwargs)  # type: ignore
-                and (4 not in {x.kind for x in self.signature.parameters.values()})  # type: ignore
-            ):
-                from ..exceptions import CustomValueError
+            raise CustomValueError(
+                'This function hasn\'t got any kwargs!', 'inject_kwargs_params.add_to_kwargs', self.function
+            )
 
-                raise CustomValueError(
-                    'This function hasn\'t got any kwargs!', 'inject_kwargs_params.add_to_kwargs', self.function
-                )
+        self._param_items = tuple(self.signature.parameters.items())
+        self._param_names = frozenset(self.signature.parameters)
 
+    def __get__(
+        self, class_obj: T, class_type: type[T]
+    ) -> inject_kwargs_params_base_func[T, P, R]:
         this = self
 
+        add_to_kwargs = isinstance(this, inject_kwargs_params.add_to_kwargs)  # type: ignore
+
         @wraps(self.function)
         def _wrapper(self: T, *_args: P.args, **kwargs: P.kwargs) -> R:
-            assert this.signature
-
-            if class_obj and not isinstance(self, class_type):  # type: ignore
-                _args = (self, *_args)
+            if class_obj and not isinstance(self, class_type):
+                _args = (self, *_args)  # type: ignore
                 self = class_obj
 
             if not hasattr(self, this._kwargs_name):
@@ -289,14 +306,22 @@ class inject_kwargs_params_base(Generic[T, P, R]):
                     f'This class doesn\'t have any "{this._kwargs_name}" attribute!', reason=self.__class__
                 )
 
-            this_kwargs = self.kwargs.copy()
+            this_kwargs = self.kwargs  # type: ignore
+
+            # None of the parameters can be overridden, so the arguments are passed through as they are
+            if this._param_names.isdisjoint(this_kwargs):
+                if add_to_kwargs:
+                    kwargs |= this_kwargs
+
+                return this.function(self, *_args, **kwargs)
+
             args, n_args = list(_args), len(_args)
 
-            for i, (key, value) in enumerate(this.signature.parameters.items()):
+            for i, (key, value) in enumerate(this._param_items):
                 if key not in this_kwargs:
                     continue
 
-                kw_value = this_kwargs.pop(key)
+                kw_value = this_kwargs[key]
 
                 if value.default is empty_param:
                     continue
@@ -312,10 +337,13 @@ class inject_kwargs_params_base(Generic[T, P, R]):
 
                     kwargs[key] = kw_value
 
-            if isinstance(this, inject_kwargs_params.add_to_kwargs):
-                kwargs |= this_kwargs
+            if add_to_kwargs:
+                # Whatever wasn't consumed by the parameters is passed on as is
+                kwargs |= {  # type: ignore
+                    k: v for k, v in this_kwargs.items() if k not in this._param_names
+                }
 
-            return this.function(self, *args, **kwargs)
+            return this.function(self, *args, **kwargs)  # type: ignore
 
         return _wrapper  # type: ignore
 
@@ -324,7 +352,7 @@ class inject_kwargs_params_base(Generic[T, P, R]):
 
     @property
     def __signature__(self) -> Signature:
-        return Signature.from_callable(self.function)
+        return self.signature
 
     @classmethod
     def with_name(cls, kwargs_name: str) -> type[inject_kwargs_params]:  # type: ignore
@@ -360,13 +388,17 @@ class complex_hash(Generic[T]):
     """
 
     def __new__(cls, class_type: T) -> T:  # type: ignore
+        keys = tuple(class_type.__annotations__.keys())
+        get_values = attrgetter(*keys) if keys else lambda _: ()
+
         class inner_class_type(class_type):  # type: ignore
             def __hash__(self) -> int:
-                return complex_hash.hash(
-                    self.__class__.__name__, *(
-                        getattr(self, key) for key in self.__annotations__.keys()
-                    )
-                )
+                values = get_values(self)
+
+                try:
+                    return hash((self.__class__.__name__, values))
+                except TypeError:
+                    return complex_hash.hash(self.__class__.__name__, values)
 
         return inner_class_type  # type: ignore
 
@@ -380,7 +412,13 @@ class complex_hash(Generic[T]):
         :return:        Hash of all the combined objects' hashes.
         """
 
-        values = list[str]()
+        # Everything is usually hashable already, only walk the values when something isn't
+        try:
+            return hash(args)
+        except TypeError:
+            pass
+
+        values: list[int] = []
         for value in args:
             try:
                 new_hash = hash(value)
@@ -390,9 +428,9 @@ class complex_hash(Generic[T]):
                 else:
                     new_hash = hash(str(value))
 
-            values.append(str(new_hash))
+            values.append(new_hash)
 
-        return hash('_'.join(values))
+        return hash(tuple(values))
 
 
 def get_subclasses(family: type[T], exclude: Sequence[type[T]] = []) -> list[type[T]]:
@@ -406,14 +444,18 @@ def get_subclasses(family: type[T], exclude: Sequence[type[T]] = []) -> list[typ
     :return:        List of all subclasses of "family".
     """
 
-    def _subclasses(cls: type[T]) -> Generator[type[T], None, None]:
+    subclasses: list[type[T]] = []
+
+    def _subclasses(cls: type[T]) -> None:
         for subclass in cls.__subclasses__():
-            yield from _subclasses(subclass)
+            _subclasses(subclass)
             if subclass in exclude:
                 continue
-            yield subclass
+            subclasses.append(subclass)
 
-    return list(set(_subclasses(family)))
+    _subclasses(family)
+
+    return list(dict.fromkeys(subclasses))
 
 
 class classproperty(Generic[P, R, T, T0, P0]):
@@ -529,7 +571,7 @@ class cachedproperty(property, Generic[P, R, T, T0, P0]):
                     self = super().__new__(cls, *args, **kwargs)
                 except TypeError:
                     self = super().__new__(cls)
-                self.__dict__.__setitem__(cachedproperty.cache_key, dict[str, Any]())
+                self.__dict__.__setitem__(cachedproperty.cache_key, {})
                 return self
 
     if TYPE_CHECKING:
@@ -549,24 +591,31 @@ class cachedproperty(property, Generic[P, R, T, T0, P0]):
             ...
 
     def __get__(self, __obj: Any, __type: type | None = None) -> R:
-        if isinstance(self.fget, classproperty):
-            function = partial(self.fget.__get__, __obj, __type)
-            __obj = __type
+        if is_classproperty := isinstance(self.fget, classproperty):
+            try:
+                cache = getattr(__type, cachedproperty.cache_key)
+            except AttributeError:
+                cache = {}
+                setattr(__type, cachedproperty.cache_key, cache)
+        else:
+            cache = __obj.__dict__.get(cachedproperty.cache_key)
 
-            if not hasattr(__obj, cachedproperty.cache_key):
-                setattr(__obj, cachedproperty.cache_key, dict[str, Any]())
+        name = self.fget.__name__  # type: ignore
 
-            cache = getattr(__obj, cachedproperty.cache_key)
-            name = self.fget.__name__
+        try:
+            return cache[name]  # type: ignore
+        except KeyError:
+            pass
+
+        # The getter is only bound on a cache miss
+        if is_classproperty:
+            value = self.fget.__get__(__obj, __type)  # type: ignore
         else:
-            function = self.fget.__get__(__obj, __type)  # type: ignore
-            cache = __obj.__dict__.get(cachedproperty.cache_key)
-            name = function.__name__
+            value = self.fget.__get__(__obj, __type)()  # type: ignore
 
-        if name not in cache:
-            cache[name] = function()
+        cache[name] = value
 
-        return cache[name]  # type: ignore
+        return value  # type: ignore
 
 
 class KwargsNotNone(KwargsT):
@@ -584,7 +633,7 @@ SingleMeta = TypeVar('SingleMeta', bound=type)
 
 
 class SingletonMeta(type):
-    _instances = dict[type[SingleMeta], SingleMeta]()  # type: ignore
+    _instances: dict[type, Any] = {}
     _singleton_init: bool
 
     def __new__(
@@ -593,12 +642,12 @@ class SingletonMeta(type):
         return type.__new__(cls, name, bases, namespace | {'_singleton_init': kwargs.pop('init', False)})
 
     def __call__(cls: type[SingletonSelf], *args: Any, **kwargs: Any) -> SingletonSelf:  # type: ignore
-        if cls not in cls._instances:
-            cls._instances[cls] = super(SingletonMeta, cls).__call__(*args, **kwargs)
+        if (instance := cls._instances.get(cls)) is None:
+            instance = cls._instances[cls] = super(SingletonMeta, cls).__call__(*args, **kwargs)
         elif cls._singleton_init:
-            cls._instances[cls].__init__(*args, **kwargs)  # type: ignore
+            instance.__init__(*args, **kwargs)
 
-        return cls._instances[cls]
+        return instance  # type: ignore
 
 
 SingletonSelf = TypeVar('SingletonSelf', bound=SingletonMeta)
@@ -609,9 +658,9 @@ class Singleton(metaclass=SingletonMeta):
 
 
 class to_singleton_impl:
-    _ts_args = tuple[str, ...]()
-    _ts_kwargs = dict[str, Any]()
-    _add_classes = tuple[type, ...]()
+    _ts_args: tuple[str, ...] = ()
+    _ts_kwargs: dict[str, Any] = {}
+    _add_classes: tuple[type, ...] = ()
 
     def __new__(_cls, cls: type[T]) -> T:  # type: ignore
         if _cls._add_classes:
@@ -637,7 +686,7 @@ class to_singleton(to_singleton_impl):
 
 
 class LinearRangeLut(Mapping[int, int]):
-    __slots__ = ('ranges', '_ranges_idx_lut', '_misses_n')
+    __slots__ = ('ranges', '_ranges_idx_lut', '_misses_n', '_bisect_lut')
 
     def __init__(self, ranges: Mapping[int, range]) -> None:
         self.ranges = ranges
@@ -645,10 +694,33 @@ class LinearRangeLut(Mapping[int, int]):
         self._ranges_idx_lut = list(self.ranges.items())
         self._misses_n = 0
 
+        # Empty ranges can never be hit, leaving them out keeps the starts strictly increasing
+        sorted_lut = sorted(((idx, k) for idx, k in self._ranges_idx_lut if k), key=lambda x: x[1].start)
+
+        self._bisect_lut: tuple[list[int], list[int], list[int]] | None = None
+
+        # Binary search only works on contiguous ranges that don't overlap, anything else goes through the scan
+        if all(k.step == 1 for _, k in sorted_lut) and all(
+            k0.stop <= k1.start for (_, k0), (_, k1) in pairwise(sorted_lut)
+        ):
+            self._bisect_lut = (
+                [k.start for _, k in sorted_lut], [k.stop for _, k in sorted_lut], [idx for idx, _ in sorted_lut]
+            )
+
     def __getitem__(self, n: int) -> int:
+        if self._bisect_lut is not None:
+            starts, stops, idxs = self._bisect_lut
+
+            if (i := bisect_right(starts, n) - 1) >= 0 and n < stops[i]:
+                return idxs[i]
+
+            raise KeyError(n)
+
         for missed_hit, (idx, k) in enumerate(self._ranges_idx_lut):
             if n in k:
                 break
+        else:
+            raise KeyError(n)
 
         if missed_hit:
             self._misses_n += 1
@@ -88,7 +88,7 @@ def check_perms(
     :raises FileWasNotFoundError:   Parent directories exist, but the given file could not be found.
     """
 
-    file = Path(str(file))
+    file = file if isinstance(file, Path) else Path(str(file))
     got_perms = False
 
     mode_i = F_OK
@@ -16,9 +16,7 @@ def copy_func(f: F) -> FunctionType:
     """Try copying a function."""
 
     try:
-        g = FunctionType(
-            f.__code__, f.__globals__, name=f.__name__, argdefs=f.__defaults__, closure=f.__closure__
-        )
+        g = FunctionType(f.__code__, f.__globals__, f.__name__, f.__defaults__, f.__closure__)
         g = update_wrapper(g, f)  # type: ignore
         g.__kwdefaults__ = f.__kwdefaults__
         return g
@@ -27,7 +25,7 @@ def copy_func(f: F) -> FunctionType:
 
 
 def erase_module(func: F, modules: Sequence[str] | None = None) -> F:
-    """Delete the __module__ of the function."""
+    """Delete the __module__ of the function, in place. Use copy_func first to keep the original untouched."""
 
     if hasattr(func, '__module__') and (True if modules is None else (func.__module__ in modules)):
         func.__module__ = None  # type: ignore
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from itertools import chain, zip_longest
+from itertools import chain, product, zip_longest
 from typing import Iterable, overload
 
 from ..exceptions import CustomIndexError
@@ -36,24 +36,11 @@ def ranges_product(*_iterables: range | int) -> Iterable[tuple[int, ...]]:
     if n_iterables <= 1:
         raise CustomIndexError(f'Not enough ranges passed! ({n_iterables})', ranges_product)
 
-    iterables = [range(x) if isinstance(x, int) else x for x in _iterables]
-
-    if n_iterables == 2:
-        first_it, second_it = iterables
-
-        for xx in first_it:
-            for yy in second_it:
-                yield xx, yy
-    elif n_iterables == 3:
-        first_it, second_it, third_it = iterables
-
-        for xx in first_it:
-            for yy in second_it:
-                for zz in third_it:
-                    yield xx, yy, zz
-    else:
+    if n_iterables > 3:
         raise CustomIndexError(f'Too many ranges passed! ({n_iterables})', ranges_product)
 
+    yield from product(*(range(x) if isinstance(x, int) else x for x in _iterables))
+
 
 def interleave_arr(arr0: Iterable[T], arr1: Iterable[T0], n: int = 2) -> Iterable[T | T0]:
     """